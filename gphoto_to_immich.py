@@ -9,26 +9,128 @@ Dependencies:
 - Python 3.8+
 - requests (for HTTP requests)
 - hashlib (built-in, for SHA-1)
-- json (built-in)
+- json (built-in; orjson is used instead if installed)
 - os, pathlib (built-in)
 - concurrent.futures (built-in, for parallelization)
 - time (built-in, for performance monitoring)
+- blake3 (optional, for --checksum-algo blake3)
+- httpx[http2] (optional, for --http2)
 """
 
 import os
+import sys
 import json
+import atexit
+import queue
+import base64
 import hashlib
+import itertools
 import time
 import logging
+import mmap
+import sqlite3
 import threading
+import http.client
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Set
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from urllib.parse import urlsplit
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
 from urllib3.util.retry import Retry
 
+# Optional: orjson for faster JSON parsing (reads bytes directly)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional: requests-toolbelt for streaming multipart uploads
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# Optional: BLAKE3 for fast local duplicate fingerprints
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# Optional: httpx for HTTP/2 uploads (many uploads multiplexed on one connection)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# Supported media file extensions (lowercase, without dot)
+MEDIA_EXTENSIONS = frozenset({
+    'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'tif',
+    'heic', 'heif', 'mp4', 'mov', 'avi', 'mkv', 'webm'
+})
+
+# Google Takeout sidecar files: "<media file name><suffix>"
+METADATA_SUFFIXES = ('.supplemental-metadata.json', '.supplemental-metadata copy.json')
+
+# Album metadata file inside each album directory
+ALBUM_METADATA_FILE = 'Metadaten.json'
+
+# Max. difference in seconds for two timestamps to count as equal
+TIMESTAMP_TOLERANCE = 1
+
+# Read size for file hashing
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Slice size when streaming a memory-mapped file into an upload request
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Files from this size on are uploaded with sendfile() over plain HTTP (Linux)
+SENDFILE_MIN_SIZE = 32 * 1024 * 1024
+
+# HTTP status codes after which a request is retried
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Number of new checksum cache entries after which they are committed
+HASH_CACHE_COMMIT_INTERVAL = 1000
+
+# Number of migrated files after which the manifest is written and synced to disk
+MANIFEST_SYNC_INTERVAL = 1000
+
+# Per-thread read buffer for file hashing (see ImmichClient._calculate_file_hash)
+_hash_buffers = threading.local()
+
+# Max. total size of files being hashed/uploaded at the same time
+MAX_IN_FLIGHT_BYTES = 4 * 1024 ** 3
+
+# Max. total size of a batch hashed ahead of its upload (the rest is hashed right before the upload)
+MAX_HASH_AHEAD_BYTES = 1024 ** 3
+
+# Timeout in seconds for establishing a connection to Immich
+CONNECT_TIMEOUT = 10
+
+# Timeout in seconds for the reachability check before the Takeout is scanned
+PING_TIMEOUT = 3
+
+# Page size for the initial sweep of existing assets (Immich maximum)
+ASSET_PAGE_SIZE = 1000
+
+# Max. number of checksums per bulk upload check request
+BULK_CHECK_SIZE = 500
+
+# Default max. number of asset IDs per album assignment request (--album-batch-size)
+ALBUM_BATCH_SIZE = 500
+
+# Adaptive batch size grows to at most this multiple of --batch-size
+MAX_BATCH_SIZE_FACTOR = 8
+
 
 # Configuration
 @dataclass
@@ -39,46 +141,198 @@ class Config:
     takeout_path: str = ""
     max_workers: int = 10
     batch_size: int = 100
+    adaptive_batch: bool = True  # grow batch_size while upload slots wait for the next batch
+    album_batch_size: int = ALBUM_BATCH_SIZE  # asset IDs per album assignment request
+    http2: bool = False  # upload assets over HTTP/2 (requires httpx[http2])
     retry_attempts: int = 3
     timeout: int = 300
     dry_run: bool = False
     verbose: bool = False
+    checksum_algo: str = "sha1"  # "sha1" or "blake3" (local duplicate detection only)
+    hash_cache_path: str = "gphoto_hash_cache.db"  # "" disables the checksum cache
+    manifest_path: str = ".immich-migrated"  # "" disables skipping files migrated in earlier runs
 
 
 # Logging Setup
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('gphoto_migration.log'),
-        logging.StreamHandler()
-    ]
+# Threads only put log records into a queue; a single background thread writes
+# them to the console and the log files, so workers never wait on file I/O.
+log_queue = queue.Queue(-1)
+
+console_handler = logging.StreamHandler()
+migration_log_handler = logging.FileHandler('gphoto_migration.log')
+for handler in (console_handler, migration_log_handler):
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+# Separate log files for specific operations
+album_creation_handler = logging.FileHandler('album_creation.log')
+album_creation_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+album_creation_handler.addFilter(logging.Filter('album_creation'))
+
+asset_album_handler = logging.FileHandler('asset_album_assignment.log')
+asset_album_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+asset_album_handler.addFilter(logging.Filter('asset_album'))
+
+log_listener = QueueListener(
+    log_queue,
+    console_handler, migration_log_handler, album_creation_handler, asset_album_handler
 )
+log_listener.start()
+atexit.register(log_listener.stop)
+
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))  # final format is applied by the listener
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
 # Separate loggers for specific operations
 album_creation_logger = logging.getLogger('album_creation')
-album_creation_handler = logging.FileHandler('album_creation.log')
-album_creation_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
-album_creation_logger.addHandler(album_creation_handler)
 album_creation_logger.setLevel(logging.INFO)
 
 asset_album_logger = logging.getLogger('asset_album')
-asset_album_handler = logging.FileHandler('asset_album_assignment.log')
-asset_album_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
-asset_album_logger.addHandler(asset_album_handler)
 asset_album_logger.setLevel(logging.INFO)
 
 logger = logging.getLogger(__name__)
 
 
+def _fadvise(fd: int, advice_name: str):
+    """Give the kernel a page cache hint for a whole file (no-op where unsupported)"""
+    advice = getattr(os, advice_name, None)
+    if advice is None:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _form_fields(data: Dict) -> List[Tuple[str, str]]:
+    """Convert form data to (name, value) pairs the way requests encodes them"""
+    fields = []
+    for name, value in data.items():
+        for item in (value if isinstance(value, list) else [value]):
+            if item is not None:
+                fields.append((name, str(item)))
+    return fields
+
+
+def _multipart_envelope(fields: List[Tuple[str, str]], file_field: str, file_name: str,
+                        boundary: str) -> Tuple[bytes, bytes]:
+    """Encode multipart/form-data around a file part the way urllib3 does
+    
+    Returns:
+        Tuple[bytes, bytes]: form fields plus header of the file part, and the closing boundary
+    """
+    parts = []
+    for name, value in fields:
+        field = RequestField(name, value)
+        field.make_multipart()
+        parts.append(f'--{boundary}\r\n{field.render_headers()}{value}\r\n')
+    file_part = RequestField(file_field, b'', filename=file_name)
+    file_part.make_multipart(content_type='application/octet-stream')
+    parts.append(f'--{boundary}\r\n{file_part.render_headers()}')
+    return ''.join(parts).encode('utf-8'), f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
+
+class _MappedMultipartBody:
+    """Multipart request body that streams the file from a memory map
+    
+    requests sends iterables chunk by chunk; __len__ lets it set Content-Length
+    instead of using chunked transfer encoding.
+    """
+    
+    def __init__(self, head: bytes, mapped_file: Optional[mmap.mmap], tail: bytes):
+        self.head = head
+        self.mapped_file = mapped_file
+        self.tail = tail
+    
+    def __len__(self) -> int:
+        file_size = len(self.mapped_file) if self.mapped_file is not None else 0
+        return len(self.head) + file_size + len(self.tail)
+    
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.head
+        if self.mapped_file is not None:
+            for offset in range(0, len(self.mapped_file), UPLOAD_CHUNK_SIZE):
+                yield self.mapped_file[offset:offset + UPLOAD_CHUNK_SIZE]
+        yield self.tail
+
+
+def _to_epoch(timestamp: Optional[str]) -> Optional[float]:
+    """Convert an ISO 8601 timestamp to seconds since epoch (None if missing or invalid)"""
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _same_timestamp(current: Optional[str], expected: Optional[str]) -> bool:
+    """Compare two ISO 8601 timestamps numerically
+    
+    Immich may return another format for the same point in time (e.g. with
+    microseconds or a timezone offset), so the strings are not compared directly.
+    """
+    current_epoch = _to_epoch(current)
+    expected_epoch = _to_epoch(expected)
+    if current_epoch is None or expected_epoch is None:
+        return False
+    return abs(current_epoch - expected_epoch) <= TIMESTAMP_TOLERANCE
+
+
+@lru_cache(maxsize=4096)
+def _album_title_for_dir(directory: str) -> Optional[str]:
+    """Read the album title from a directory's Metadaten.json (None if not an album)
+    
+    Called concurrently by the upload workers, so the same directory may be read
+    more than once; the album is reported when it is first registered instead.
+    """
+    metadata_file = os.path.join(directory, ALBUM_METADATA_FILE)
+    try:
+        with open(metadata_file, 'rb') as f:
+            album_title = json_loads(f.read()).get('title', '')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read album metadata {metadata_file}: {e}")
+        return None
+    return album_title
+
+
 class ImmichClient:
     """Client for interacting with Immich API"""
     
     def __init__(self, config: Config):
         self.config = config
         self.session = self._create_session()
+        self._upload_client = self._create_http2_client() if config.http2 else None
+        # Zero-copy uploads need direct access to an unencrypted socket
+        self._sendfile_uploads = sys.platform.startswith('linux') and config.immich_url.startswith('http://')
         self._album_cache = {}
+        self._dry_run_ids = itertools.count(1)
         self._album_creation_lock = threading.Lock()
+        # Albums already counted in the statistics (existing or created)
+        self._album_stats_tracked: Set[str] = set()
+        # Queued album assignments: (album ID, album title) -> (asset ID, outcome) pairs
+        self._album_pending: Dict[Tuple[str, str], List[Tuple[str, Future]]] = {}
+        self._album_pending_lock = threading.Lock()
+        # SHA-1 (hex) -> metadata of assets that already exist in Immich
+        self._asset_info_cache: Dict[str, Dict] = {}
+        # Local fingerprint -> asset ID of files already uploaded in this run
+        self._fingerprint_cache: Dict[str, str] = {}
+        self._use_blake3 = config.checksum_algo == 'blake3'
+        if self._use_blake3 and blake3 is None:
+            logger.warning("blake3 is not installed - falling back to SHA-1 (pip3 install blake3)")
+            self._use_blake3 = False
+        # Pending SHA-1 checksums computed ahead of the upload workers
+        self._checksums: Dict[Path, Future] = {}
+        self._hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4,
+                                                 thread_name_prefix='hash')
+        # On-disk checksum cache, so reruns do not hash unchanged files again
+        self._hash_db = None
+        self._hash_db_lock = threading.Lock()
+        self._hash_db_uncommitted = 0
+        if config.hash_cache_path and not config.dry_run:
+            self._hash_db = self._open_hash_cache(config.hash_cache_path)
     
     def _create_session(self):
         """Create HTTP session with retry logic"""
@@ -88,34 +342,97 @@ class ImmichClient:
         retry_strategy = Retry(
             total=self.config.retry_attempts,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=RETRY_STATUS_CODES,
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Pool large enough for all workers (default: 10 connections), so
+        # connections are reused instead of being discarded and reopened
+        adapter = HTTPAdapter(
+            pool_connections=self.config.max_workers * 2,
+            pool_maxsize=self.config.max_workers * 4,
+            max_retries=retry_strategy,
+            pool_block=True
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         # Set headers
         session.headers.update({
-            'X-API-Key': self.config.immich_api_key
+            'X-API-Key': self.config.immich_api_key,
+            'Accept': 'application/json'
             # Content-Type wird automatisch für multipart/form-data gesetzt
         })
         
         return session
     
-    def upload_asset(self, file_path: Path, metadata: Dict, album_title: Optional[str] = None) -> Optional[Dict]:
-        """Upload an asset to Immich"""
+    def _create_http2_client(self):
+        """Create httpx client for asset uploads over HTTP/2 (None if not available)
+        
+        All other API calls stay on the requests session. HTTP/2 is only
+        negotiated for https:// URLs; plain http:// falls back to HTTP/1.1.
+        """
+        if httpx is None:
+            logger.warning("httpx is not installed - uploading over HTTP/1.1 (pip3 install 'httpx[http2]')")
+            return None
+        
+        try:
+            transport = httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=self.config.max_workers,
+                                    max_keepalive_connections=self.config.max_workers),
+                retries=self.config.retry_attempts  # connection errors only
+            )
+        except ImportError:
+            logger.warning("h2 is not installed - uploading over HTTP/1.1 (pip3 install 'httpx[http2]')")
+            return None
+        
+        return httpx.Client(
+            transport=transport,
+            headers={'X-API-Key': self.config.immich_api_key, 'Accept': 'application/json'},
+            timeout=httpx.Timeout(self.config.timeout, connect=CONNECT_TIMEOUT)
+        )
+    
+    def upload_asset(self, file_path: Path, metadata: Dict, album_title: Optional[str] = None,
+                     existing_asset_id: Optional[str] = None) -> Optional[Dict]:
+        """Upload an asset to Immich
+        
+        Args:
+            existing_asset_id: ID of the asset if Immich already has this file;
+                the upload is skipped and only metadata and album are synced
+        """
         if self.config.dry_run:
-            logger.info(f"[DRY RUN] Would upload: {file_path}")
+            album_note = f" (album: {album_title})" if album_title else ""
+            logger.info(f"[DRY RUN] Would upload: {file_path}{album_note}")
             return {
-                'asset_id': f'dry_run_{hash(str(file_path))}',
+                'asset_id': f'dry_run_{next(self._dry_run_ids)}',
                 'is_duplicate': False,
                 'metadata_updated': False
             }
         
         try:
+            # Fast local fingerprint: skip files whose content was already uploaded in this run.
+            # Not needed if the bulk check already found the file in Immich.
+            fingerprint = None
+            if self._use_blake3 and not existing_asset_id:
+                fingerprint = self._calculate_fingerprint(file_path)
+                known_asset_id = self._fingerprint_cache.get(fingerprint)
+                if known_asset_id:
+                    if self.config.verbose:
+                        logger.info(f"Content already uploaded in this run, skipping upload: {file_path} -> {known_asset_id}")
+                    return self._finalize_asset(file_path, known_asset_id, True, metadata, album_title)
+            
             # Calculate file hash for duplicate detection
-            file_hash = self._calculate_file_hash(file_path)
+            file_hash = self._get_checksum(file_path)
+            
+            # Files outside the hash lookahead were not checked by find_existing_assets
+            if not existing_asset_id and file_hash in self._asset_info_cache:
+                existing_asset_id = self._asset_info_cache[file_hash]['id']
+            
+            if existing_asset_id:
+                if self.config.verbose:
+                    logger.info(f"Asset already exists in Immich, skipping upload: {file_path} -> {existing_asset_id}")
+                asset_info = self._asset_info_cache.get(file_hash)
+                return self._finalize_asset(file_path, existing_asset_id, True, metadata, album_title, asset_info)
             
             # Prepare upload data
             upload_data = {
@@ -130,19 +447,13 @@ class ImmichClient:
             # Add checksum header
             headers = {'x-immich-checksum': file_hash}
             
-            # Prepare files for upload
-            files = {'assetData': open(file_path, 'rb')}
-            
-            # Upload asset
-            response = self.session.post(
-                f"{self.config.immich_url}/api/assets",
-                data=upload_data,
-                files=files,
-                headers=headers,
-                timeout=self.config.timeout
-            )
-            
-            files['assetData'].close()
+            # Upload asset - files outside the hash lookahead were hashed just
+            # before, so their second read is usually served from the page cache.
+            # The file is closed even if the request raises.
+            with open(file_path, 'rb') as asset_file:
+                response = self._post_asset(file_path, asset_file, upload_data, headers)
+                # File is not needed anymore - keep the page cache for files still to come
+                _fadvise(asset_file.fileno(), 'POSIX_FADV_DONTNEED')
             
             # Logging based on verbosity level
             if self.config.verbose:
@@ -157,38 +468,14 @@ class ImmichClient:
                 # Check if it's a duplicate
                 is_duplicate = response.status_code == 200 and asset_data.get('status') == 'duplicate'
                 
-                # Check and update metadata
-                metadata_updated = self._check_and_update_metadata(asset_id, metadata)
-                if metadata_updated:
-                    if hasattr(self, '_processor') and hasattr(self._processor, 'stats'):
-                        self._processor.stats['metadata_updates'] += 1
-                else:
-                    if hasattr(self, '_processor') and hasattr(self._processor, 'stats'):
-                        self._processor.stats['metadata_already_correct'] += 1
-                
-                # Add to album if present
-                album_added = False
-                if album_title:
-                    album_added = self._add_to_album(asset_id, album_title)
+                if fingerprint:
+                    self._fingerprint_cache[fingerprint] = asset_id
                 
-                # Single line logging for non-verbose mode
-                if not self.config.verbose:
-                    status = "🔄" if is_duplicate else "✅"
-                    metadata_status = "📝" if metadata_updated else ""
-                    album_status = "📁" if album_added else ""
-                    logger.info(f"{status} {file_path.name} {metadata_status} {album_status}")
-                else:
-                    # Verbose logging (existing detailed logs)
-                    if is_duplicate:
-                        logger.info(f"Asset already exists (duplicate): {file_path} -> {asset_id}")
-                    else:
-                        logger.info(f"Asset successfully uploaded: {file_path} -> {asset_id}")
+                # Duplicates: use the metadata loaded at startup (None -> fetched on demand).
+                # New uploads: Immich has not extracted any EXIF yet, so nothing to compare.
+                asset_info = self._asset_info_cache.get(file_hash) if is_duplicate else {}
                 
-                return {
-                    'asset_id': asset_id,
-                    'is_duplicate': is_duplicate,
-                    'metadata_updated': metadata_updated
-                }
+                return self._finalize_asset(file_path, asset_id, is_duplicate, metadata, album_title, asset_info)
             else:
                 return None
                 
@@ -196,32 +483,354 @@ class ImmichClient:
             logger.error(f"Error uploading {file_path}: {e}")
             return None
     
-    def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-1 hash of file"""
-        hash_sha1 = hashlib.sha1()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha1.update(chunk)
-        return hash_sha1.hexdigest()
+    def _post_asset(self, file_path: Path, asset_file, upload_data: Dict, headers: Dict) -> requests.Response:
+        """POST an asset as multipart/form-data
+        
+        With --http2 the upload goes through httpx, which streams the file.
+        Large files over plain HTTP on Linux are sent with sendfile().
+        With requests-toolbelt the body is streamed from the open file in small
+        chunks; otherwise the file is memory-mapped and sent in slices, so
+        large videos are never read into memory as a whole.
+        """
+        url = f"{self.config.immich_url}/api/assets"
+        timeout = (CONNECT_TIMEOUT, self.config.timeout)
+        
+        if self._upload_client is None and self._sendfile_uploads:
+            file_size = os.fstat(asset_file.fileno()).st_size
+            if file_size >= SENDFILE_MIN_SIZE:
+                return self._post_asset_sendfile(file_path, asset_file, file_size, upload_data, headers)
+        
+        if self._upload_client is not None:
+            fields: Dict[str, List[str]] = {}
+            for name, value in _form_fields(upload_data):
+                fields.setdefault(name, []).append(value)
+            return self._upload_client.post(
+                url,
+                data=fields,
+                files={'assetData': (file_path.name, asset_file)},
+                headers=headers
+            )
+        
+        if MultipartEncoder is None:
+            boundary = choose_boundary()
+            head, tail = _multipart_envelope(_form_fields(upload_data), 'assetData', file_path.name, boundary)
+            # Empty files cannot be memory-mapped
+            mapped_file = None
+            if os.fstat(asset_file.fileno()).st_size:
+                mapped_file = mmap.mmap(asset_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return self.session.post(
+                    url,
+                    data=_MappedMultipartBody(head, mapped_file, tail),
+                    headers={**headers, 'Content-Type': f'multipart/form-data; boundary={boundary}'},
+                    timeout=timeout
+                )
+            finally:
+                if mapped_file is not None:
+                    mapped_file.close()
+        
+        encoder = MultipartEncoder(fields=_form_fields(upload_data) + [('assetData', (file_path.name, asset_file))])
+        return self.session.post(
+            url,
+            data=encoder,
+            headers={**headers, 'Content-Type': encoder.content_type},
+            timeout=timeout
+        )
     
-    def _check_and_update_metadata(self, asset_id: str, metadata: Dict) -> bool:
-        """Check and update metadata of an existing asset
+    def _post_asset_sendfile(self, file_path: Path, asset_file, file_size: int,
+                             upload_data: Dict, headers: Dict) -> requests.Response:
+        """POST an asset over plain HTTP, with the file part sent by sendfile()
+        
+        The kernel copies the file from the page cache to the socket without
+        passing it through Python. Uses its own connection outside the session
+        pool, so failed attempts (connection errors, RETRY_STATUS_CODES) are
+        retried here with the same attempts and backoff as the session.
+        Immich deduplicates by checksum, so repeating the POST is safe.
+        """
+        for attempt in range(self.config.retry_attempts + 1):
+            if attempt:
+                time.sleep(2 ** (attempt - 1))
+            try:
+                response = self._send_asset_sendfile(file_path, asset_file, file_size, upload_data, headers)
+            except (OSError, http.client.HTTPException) as e:
+                if attempt == self.config.retry_attempts:
+                    raise
+                logger.debug(f"Upload of {file_path.name} failed ({e}), retrying")
+                continue
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.config.retry_attempts:
+                return response
+            logger.debug(f"Upload of {file_path.name} returned {response.status_code}, retrying")
+    
+    def _send_asset_sendfile(self, file_path: Path, asset_file, file_size: int,
+                             upload_data: Dict, headers: Dict) -> requests.Response:
+        """Send one sendfile() upload attempt (see _post_asset_sendfile)"""
+        url = urlsplit(self.config.immich_url)
+        boundary = choose_boundary()
+        head, tail = _multipart_envelope(_form_fields(upload_data), 'assetData', file_path.name, boundary)
+        
+        connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=CONNECT_TIMEOUT)
+        try:
+            connection.connect()
+            connection.sock.settimeout(self.config.timeout)
+            connection.putrequest('POST', f"{url.path.rstrip('/')}/api/assets")
+            request_headers = {
+                'X-API-Key': self.config.immich_api_key,
+                'Accept': 'application/json',
+                **headers,
+                'Content-Type': f'multipart/form-data; boundary={boundary}',
+                'Content-Length': str(len(head) + file_size + len(tail))
+            }
+            for name, value in request_headers.items():
+                connection.putheader(name, value)
+            connection.endheaders(head)
+            connection.sock.sendfile(asset_file, 0, file_size)
+            connection.send(tail)
+            
+            # Same interface as the responses of the requests session
+            raw_response = connection.getresponse()
+            response = requests.Response()
+            response.status_code = raw_response.status
+            response.reason = raw_response.reason
+            response.headers = requests.structures.CaseInsensitiveDict(raw_response.getheaders())
+            response._content = raw_response.read()
+            response.url = f"{self.config.immich_url}/api/assets"
+            return response
+        finally:
+            connection.close()
+    
+    def _finalize_asset(self, file_path: Path, asset_id: str, is_duplicate: bool,
+                        metadata: Dict, album_title: Optional[str],
+                        asset_info: Optional[Dict] = None) -> Dict:
+        """Sync metadata and album membership of an uploaded (or already known) asset"""
+        # Check and update metadata (None: check or update failed)
+        metadata_updated = self._check_and_update_metadata(asset_id, metadata, asset_info)
+        if hasattr(self, '_processor') and hasattr(self._processor, 'stats'):
+            if metadata_updated is None:
+                self._processor.stats['metadata_failed'] += 1
+            elif metadata_updated:
+                self._processor.stats['metadata_updates'] += 1
+            else:
+                self._processor.stats['metadata_already_correct'] += 1
+        
+        # Add to album if present (queued; the outcome is known once the batch is sent)
+        album_result = self._add_to_album(asset_id, album_title) if album_title else None
+        album_added = album_result is not None
+        
+        # Single line logging for non-verbose mode
+        if not self.config.verbose:
+            status = "🔄" if is_duplicate else "✅"
+            metadata_status = "📝" if metadata_updated else ""
+            album_status = "📁" if album_added else ""
+            logger.info(f"{status} {file_path.name} {metadata_status} {album_status}")
+        else:
+            # Verbose logging (existing detailed logs)
+            if is_duplicate:
+                logger.info(f"Asset already exists (duplicate): {file_path} -> {asset_id}")
+            else:
+                logger.info(f"Asset successfully uploaded: {file_path} -> {asset_id}")
+        
+        return {
+            'asset_id': asset_id,
+            'is_duplicate': is_duplicate,
+            'metadata_updated': bool(metadata_updated),
+            'album_result': album_result,
+            # Metadata synced and album assignment queued (False: worth retrying in a later run)
+            'complete': metadata_updated is not None and (album_added or not album_title)
+        }
+    
+    def precompute_checksums(self, file_paths: List[Path]):
+        """Start hashing a batch of files in parallel, ahead of their upload
+        
+        hashlib releases the GIL while hashing, so a thread per CPU core
+        hashes several files at once without the overhead of extra processes.
+        """
+        if self.config.dry_run:
+            return
+        for file_path in file_paths:
+            if file_path not in self._checksums:
+                self._checksums[file_path] = self._hash_executor.submit(self._cached_file_hash, file_path)
+    
+    def find_existing_assets(self, file_paths: List[Path]) -> Dict[Path, str]:
+        """Find files that already exist in Immich, before uploading them
+        
+        Uses the precomputed checksums; checksums not in the asset cache are
+        checked with one bulk request per BULK_CHECK_SIZE files. Files without
+        a precomputed checksum are left to upload_asset, which hashes them
+        right before the upload.
+        
+        Returns:
+            Dict: file path -> ID of the existing asset
+        """
+        if self.config.dry_run:
+            return {}
+        
+        checksums = {}
+        for file_path in file_paths:
+            future = self._checksums.get(file_path)
+            if future is None:
+                continue
+            try:
+                checksums[file_path] = future.result()
+            except Exception:
+                continue  # Reported when the file is uploaded
+        
+        existing = {
+            checksum: self._asset_info_cache[checksum]['id']
+            for checksum in set(checksums.values()) if checksum in self._asset_info_cache
+        }
+        unknown = [checksum for checksum in set(checksums.values()) if checksum not in existing]
+        for i in range(0, len(unknown), BULK_CHECK_SIZE):
+            existing.update(self._bulk_upload_check(unknown[i:i + BULK_CHECK_SIZE]))
+        
+        return {file_path: existing[checksum] for file_path, checksum in checksums.items() if checksum in existing}
+    
+    def _bulk_upload_check(self, checksums: List[str]) -> Dict[str, str]:
+        """Ask Immich which checksums already exist
         
         Returns:
-            bool: True if metadata was updated, False if already correct
+            Dict: checksum -> ID of the existing asset
         """
         try:
-            # Get asset information
-            response = self.session.get(
-                f"{self.config.immich_url}/api/assets/{asset_id}",
+            response = self.session.post(
+                f"{self.config.immich_url}/api/assets/bulk-upload-check",
+                json={'assets': [{'id': checksum, 'checksum': checksum} for checksum in checksums]},
                 timeout=30
             )
             
             if response.status_code != 200:
-                logger.warning(f"Could not retrieve asset information for {asset_id}")
-                return False
+                logger.warning(f"Bulk upload check failed: {response.status_code} - {response.text}")
+                return {}
+            
+            return {
+                result['id']: result['assetId']
+                for result in response.json().get('results', [])
+                if result.get('action') == 'reject' and result.get('reason') == 'duplicate' and result.get('assetId')
+            }
+            
+        except Exception as e:
+            logger.warning(f"Error during bulk upload check: {e}")
+            return {}
+    
+    def _get_checksum(self, file_path: Path) -> str:
+        """Get SHA-1 of file, using the precomputed result if available"""
+        future = self._checksums.pop(file_path, None)
+        if future is not None:
+            return future.result()
+        return self._cached_file_hash(file_path)
+    
+    def discard_checksum(self, file_path: Path):
+        """Drop the precomputed checksum of a file that is not uploaded after all"""
+        future = self._checksums.pop(file_path, None)
+        if future is not None:
+            future.cancel()
+    
+    def _open_hash_cache(self, db_path: str) -> Optional[sqlite3.Connection]:
+        """Open (or create) the SQLite checksum cache"""
+        try:
+            db = sqlite3.connect(db_path, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS file_hashes ('
+                'path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, sha1 TEXT NOT NULL)'
+            )
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open checksum cache {db_path}: {e}")
+            return None
+    
+    def _cached_file_hash(self, file_path: Path) -> str:
+        """Get SHA-1 of file from the checksum cache; hash only new or changed files"""
+        if self._hash_db is None:
+            return self._calculate_file_hash(file_path)
+        
+        # Absolute path: a rerun from another working directory still hits the cache
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        with self._hash_db_lock:
+            row = self._hash_db.execute(
+                'SELECT sha1 FROM file_hashes WHERE path = ? AND mtime_ns = ? AND size = ?', key
+            ).fetchone()
+        if row:
+            return row[0]
+        
+        file_hash = self._calculate_file_hash(file_path)
+        with self._hash_db_lock:
+            self._hash_db.execute('INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)', (*key, file_hash))
+            self._hash_db_uncommitted += 1
+            if self._hash_db_uncommitted >= HASH_CACHE_COMMIT_INTERVAL:
+                self._hash_db.commit()
+                self._hash_db_uncommitted = 0
+        return file_hash
+    
+    def close(self):
+        """Release HTTP connections and hashing threads, write pending checksum cache entries"""
+        # Checksums not picked up by an upload anymore (e.g. after Ctrl+C) are not needed
+        for future in self._checksums.values():
+            future.cancel()
+        self._hash_executor.shutdown(wait=True)
+        self.session.close()
+        if self._upload_client is not None:
+            self._upload_client.close()
+        with self._hash_db_lock:
+            if self._hash_db is not None:
+                self._hash_db.commit()
+                self._hash_db.close()
+                self._hash_db = None
+    
+    def _calculate_fingerprint(self, file_path: Path) -> str:
+        """Calculate BLAKE3 fingerprint of file (multi-threaded, memory-mapped)"""
+        hasher = blake3(max_threads=blake3.AUTO)
+        hasher.update_mmap(file_path)
+        return hasher.hexdigest()
+    
+    def _calculate_file_hash(self, file_path: Path) -> str:
+        """Calculate SHA-1 hash of file
+        
+        Reads into a reusable per-thread buffer, so no new bytes object is
+        allocated per chunk (hashlib.file_digest allocates a fresh buffer per
+        file and reads only 256 KiB at a time).
+        """
+        buffer = getattr(_hash_buffers, 'buffer', None)
+        if buffer is None:
+            buffer = _hash_buffers.buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        
+        hash_sha1 = hashlib.sha1()
+        with open(file_path, "rb", buffering=0) as f:
+            _fadvise(f.fileno(), 'POSIX_FADV_SEQUENTIAL')
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                hash_sha1.update(view[:size])
+        return hash_sha1.hexdigest()
+    
+    def _check_and_update_metadata(self, asset_id: str, metadata: Dict,
+                                   asset_info: Optional[Dict] = None) -> Optional[bool]:
+        """Check and update metadata of an existing asset
+        
+        Args:
+            asset_info: Known asset information; fetched from Immich if None
+        
+        Returns:
+            Optional[bool]: True if metadata was updated, False if already correct,
+                None if the check or the update failed
+        """
+        try:
+            if asset_info is None:
+                # Get asset information
+                response = self.session.get(
+                    f"{self.config.immich_url}/api/assets/{asset_id}",
+                    timeout=30
+                )
+                
+                if response.status_code != 200:
+                    logger.warning(f"Could not retrieve asset information for {asset_id}")
+                    return None
+                
+                asset_info = response.json()
             
-            asset_info = response.json()
             needs_update = False
             update_data = {'ids': [asset_id]}
             
@@ -233,19 +842,19 @@ class ImmichClient:
                 current_file_created = asset_info.get('fileCreatedAt')
                 
                 if self.config.verbose:
-                    logger.info(f"Asset {asset_id}: Expected date: {expected_created_at}")
-                    logger.info(f"Asset {asset_id}: Current EXIF date: {current_exif_date}")
-                    logger.info(f"Asset {asset_id}: Current fileCreatedAt: {current_file_created}")
+                    logger.debug(f"Asset {asset_id}: Expected date: {expected_created_at}")
+                    logger.debug(f"Asset {asset_id}: Current EXIF date: {current_exif_date}")
+                    logger.debug(f"Asset {asset_id}: Current fileCreatedAt: {current_file_created}")
                 
                 # Check if EXIF date needs to be updated
-                if current_exif_date != expected_created_at:
+                if not _same_timestamp(current_exif_date, expected_created_at):
                     if self.config.verbose:
                         logger.info(f"Asset {asset_id}: EXIF date differs - update required")
                     update_data['dateTimeOriginal'] = expected_created_at
                     needs_update = True
                 
                 # Check if fileCreatedAt needs to be updated
-                if current_file_created != expected_created_at:
+                if not _same_timestamp(current_file_created, expected_created_at):
                     if self.config.verbose:
                         logger.info(f"Asset {asset_id}: fileCreatedAt differs - update required")
                     # For fileCreatedAt we use dateTimeOriginal (this is the correct parameter)
@@ -263,8 +872,8 @@ class ImmichClient:
                 expected_lon = geo_data.get('longitude')
                 
                 if self.config.verbose:
-                    logger.info(f"Asset {asset_id}: Expected geo data: {expected_lat}, {expected_lon}")
-                    logger.info(f"Asset {asset_id}: Current geo data: {current_lat}, {current_lon}")
+                    logger.debug(f"Asset {asset_id}: Expected geo data: {expected_lat}, {expected_lon}")
+                    logger.debug(f"Asset {asset_id}: Current geo data: {current_lat}, {current_lon}")
                 
                 # Check if geo data is missing or differs
                 if (current_lat is None or current_lon is None or 
@@ -280,8 +889,7 @@ class ImmichClient:
             if needs_update:
                 if self.config.verbose:
                     logger.info(f"Asset {asset_id}: Updating metadata with: {update_data}")
-                self._update_asset_metadata(update_data)
-                return True
+                return True if self._send_metadata_update(update_data) else None
             else:
                 if self.config.verbose:
                     logger.info(f"Asset {asset_id}: Metadata is already correct")
@@ -289,10 +897,18 @@ class ImmichClient:
                 
         except Exception as e:
             logger.warning(f"Error checking metadata for asset {asset_id}: {e}")
-            return False
+            return None
     
-    def _update_asset_metadata(self, update_data: Dict):
-        """Update asset metadata"""
+    def _send_metadata_update(self, update_data: Dict) -> bool:
+        """Update metadata of one or more assets
+        
+        Sent directly from the upload worker: capture times differ from photo
+        to photo, so waiting for other assets with identical values to share a
+        bulk request would only delay the update.
+        
+        Returns:
+            bool: True if Immich accepted the update
+        """
         try:
             response = self.session.put(
                 f"{self.config.immich_url}/api/assets",
@@ -302,71 +918,106 @@ class ImmichClient:
             
             if response.status_code == 204:
                 if self.config.verbose:
-                    logger.info(f"Asset metadata successfully updated for Asset {update_data['ids'][0]}")
-            else:
-                if self.config.verbose:
-                    logger.warning(f"Asset metadata update failed: {response.status_code} - {response.text}")
+                    logger.info(f"Asset metadata successfully updated for {len(update_data['ids'])} asset(s)")
+                return True
+            
+            if self.config.verbose:
+                logger.warning(f"Asset metadata update failed: {response.status_code} - {response.text}")
+            return False
                 
         except Exception as e:
             logger.warning(f"Error updating asset metadata: {e}")
+            return False
     
-    def _add_to_album(self, asset_id: str, album_title: str) -> bool:
-        """Add asset to album
+    def _add_to_album(self, asset_id: str, album_title: str) -> Optional[Future]:
+        """Queue asset for adding to album
+        
+        Assets are sent in one request per config.album_batch_size assets of an album;
+        remaining assets are sent by flush_albums().
         
         Returns:
-            bool: True if successfully added, False otherwise
+            Future: resolves to True once the asset was added to the album (False
+                if that failed); None if the asset could not be queued
         """
         try:
             album_id = self._get_or_create_album(album_title)
             if not album_id:
-                return False
+                return None
             
+            album_key = (album_id, album_title)
+            result = Future()
+            with self._album_pending_lock:
+                queued = self._album_pending.setdefault(album_key, [])
+                queued.append((asset_id, result))
+                if len(queued) < self.config.album_batch_size:
+                    return result
+                del self._album_pending[album_key]
+            
+            self._send_album_assets(album_id, album_title, queued)
+            return result
+                
+        except Exception as e:
+            if self.config.verbose:
+                logger.warning(f"Error adding asset {asset_id} to album {album_title}: {e}")
+            return None
+    
+    def flush_albums(self):
+        """Send all queued album assignments"""
+        with self._album_pending_lock:
+            pending = self._album_pending
+            self._album_pending = {}
+        
+        for (album_id, album_title), queued in pending.items():
+            self._send_album_assets(album_id, album_title, queued)
+    
+    def _send_album_assets(self, album_id: str, album_title: str, queued: List[Tuple[str, Future]]):
+        """Add several assets to an album in one request and resolve their outcomes"""
+        asset_ids = [asset_id for asset_id, _ in queued]
+        added: Set[str] = set()
+        try:
             response = self.session.put(
                 f"{self.config.immich_url}/api/albums/{album_id}/assets",
-                json={'ids': [asset_id]},
+                json={'ids': asset_ids},
                 timeout=30
             )
             
             if response.status_code == 200:
                 if self.config.verbose:
-                    logger.info(f"Asset {asset_id} successfully added to album {album_title}")
-                    # Write to separate asset-album assignment log
-                    asset_album_logger.info(f"Asset added to album: Asset {asset_id} -> Album '{album_title}'")
-                return True
+                    logger.info(f"{len(asset_ids)} asset(s) added to album {album_title}")
+                # Collect the result per asset (verbose: also in the asset-album assignment log)
+                for result in response.json():
+                    if result.get('success') or result.get('error') == 'duplicate':
+                        added.add(result['id'])
+                        if self.config.verbose:
+                            asset_album_logger.info(f"Asset added to album: Asset {result['id']} -> Album '{album_title}'")
+                    elif self.config.verbose:
+                        asset_album_logger.warning(f"ERROR: Asset {result['id']} could not be added to album '{album_title}': {result.get('error')}")
             else:
                 if self.config.verbose:
-                    logger.warning(f"Asset {asset_id} could not be added to album {album_title}: {response.status_code} - {response.text}")
+                    logger.warning(f"{len(asset_ids)} asset(s) could not be added to album {album_title}: {response.status_code} - {response.text}")
                     # Log failed assignment as well
-                    asset_album_logger.warning(f"ERROR: Asset {asset_id} could not be added to album '{album_title}': {response.status_code} - {response.text}")
-                return False
+                    for asset_id in asset_ids:
+                        asset_album_logger.warning(f"ERROR: Asset {asset_id} could not be added to album '{album_title}': {response.status_code} - {response.text}")
                 
         except Exception as e:
-            if self.config.verbose:
-                logger.warning(f"Error adding asset {asset_id} to album {album_title}: {e}")
-            return False
+            logger.warning(f"Error adding {len(asset_ids)} asset(s) to album {album_title}: {e}")
+        
+        for asset_id, result in queued:
+            result.set_result(asset_id in added)
     
     def _get_or_create_album(self, album_title: str) -> str:
         """Get album ID from cache or create new album (thread-safe)"""
         # First check if album is already in cache
-        if album_title in self._album_cache:
-            # Album already exists - log it
+        album_id = self._album_cache.get(album_title)
+        if album_id:
+            # Album already exists - per-asset message only at DEBUG level (--verbose),
+            # through the main logger: album_creation_logger stays at INFO
             if self.config.verbose:
-                album_creation_logger.info(f"Album already exists: '{album_title}' (ID: {self._album_cache[album_title]})")
+                logger.debug(f"Album already exists: '{album_title}' (ID: {album_id})")
             # Update statistics (only once per album)
-            if not hasattr(self, '_album_stats_tracked'):
-                self._album_stats_tracked = set()
             if album_title not in self._album_stats_tracked:
-                self._album_stats_tracked.add(album_title)
-                # Update statistics via processor
-                if hasattr(self, '_processor') and hasattr(self._processor, 'stats'):
-                    self._processor.stats['albums_existing'] += 1
-                # Add album to list (only once per album)
-                if album_title not in [album['name'] for album in self._processor.existing_albums]:
-                    self._processor.existing_albums.append({
-                        'name': album_title,
-                        'id': self._album_cache[album_title]
-                    })
-            return self._album_cache[album_title]
+                self._track_existing_album(album_title, album_id)
+            return album_id
         
         # Thread-safe album creation
         with self._album_creation_lock:
@@ -389,6 +1040,8 @@ class ImmichClient:
                     album_id = album_data['id']
                     # Update cache immediately to prevent multiple creation
                     self._album_cache[album_title] = album_id
+                    # Created in this run - must not be counted as existing album
+                    self._album_stats_tracked.add(album_title)
                     logger.info(f"New album created: {album_title}")
                     # Write to separate album creation log
                     album_creation_logger.info(f"Album created: '{album_title}' (ID: {album_id})")
@@ -409,6 +1062,40 @@ class ImmichClient:
                 logger.error(f"Error creating album {album_title}: {e}")
                 return ""
     
+    def _track_existing_album(self, album_title: str, album_id: str):
+        """Count an already existing album once in the statistics"""
+        with self._album_creation_lock:
+            if album_title in self._album_stats_tracked:
+                return
+            self._album_stats_tracked.add(album_title)
+        
+        logger.info(f"Found album: {album_title}")
+        # Update statistics via processor
+        if hasattr(self, '_processor') and hasattr(self._processor, 'stats'):
+            self._processor.stats['albums_existing'] += 1
+            self._processor.existing_albums.append({
+                'name': album_title,
+                'id': album_id
+            })
+    
+    def ping(self) -> bool:
+        """Check that the Immich server is reachable
+        
+        Sent without the session's retries, so an unreachable server is
+        reported after PING_TIMEOUT instead of after several backoff rounds.
+        """
+        try:
+            response = requests.get(
+                f"{self.config.immich_url}/api/server/ping",
+                headers=self.session.headers,
+                timeout=PING_TIMEOUT
+            )
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.error(f"Immich server not reachable at {self.config.immich_url}: {e}")
+            return False
+    
     def load_existing_albums(self):
         """Load existing albums from Immich"""
         try:
@@ -427,6 +1114,50 @@ class ImmichClient:
                 
         except Exception as e:
             logger.warning(f"Error loading existing albums: {e}")
+    
+    def load_existing_assets(self):
+        """Load checksum and metadata of all existing assets from Immich
+        
+        Lets duplicates be checked against this cache instead of one
+        GET /api/assets/{id} per file.
+        """
+        page = 1
+        try:
+            while page:
+                response = self.session.post(
+                    f"{self.config.immich_url}/api/search/metadata",
+                    json={'page': page, 'size': ASSET_PAGE_SIZE, 'withExif': True},
+                    timeout=self.config.timeout
+                )
+                
+                if response.status_code != 200:
+                    logger.warning(f"Could not load existing assets: {response.status_code}")
+                    return
+                
+                assets = response.json().get('assets', {})
+                for asset in assets.get('items', []):
+                    if not asset.get('checksum'):
+                        continue
+                    # Keep only the ID and the fields compared in _check_and_update_metadata
+                    exif_info = asset.get('exifInfo') or {}
+                    checksum = base64.b64decode(asset['checksum']).hex()
+                    self._asset_info_cache[checksum] = {
+                        'id': asset['id'],
+                        'fileCreatedAt': asset.get('fileCreatedAt'),
+                        'exifInfo': {
+                            'dateTimeOriginal': exif_info.get('dateTimeOriginal'),
+                            'latitude': exif_info.get('latitude'),
+                            'longitude': exif_info.get('longitude')
+                        }
+                    }
+                
+                next_page = assets.get('nextPage')
+                page = int(next_page) if next_page else None
+            
+            logger.info(f"Loaded: {len(self._asset_info_cache)} existing assets")
+            
+        except Exception as e:
+            logger.warning(f"Error loading existing assets: {e}")
 
 
 class GooglePhotosProcessor:
@@ -437,7 +1168,6 @@ class GooglePhotosProcessor:
         self.immich_client = ImmichClient(config)
         # Link client with processor for statistics
         self.immich_client._processor = self
-        self.processed_files: Set[str] = set()
         self.stats = {
             'total_files': 0,
             'processed_files': 0,
@@ -448,135 +1178,322 @@ class GooglePhotosProcessor:
             'albums_existing': 0,
             'metadata_updates': 0,
             'metadata_already_correct': 0,
+            'metadata_failed': 0,
+            'skipped_files': 0,
             'start_time': time.time()
         }
         # List of created albums for detailed output
         self.created_albums = []
         self.existing_albums = []
+        # Manifest of files completely migrated in earlier runs ("absolute path|size|mtime_ns" per line)
+        self._manifest_file = None
+        self._migrated: Set[str] = set()
+        self._manifest_keys: Dict[Path, str] = {}  # keys of files in progress
+        # Migrated files not yet written: (key, outcome of the album assignment if one is awaited)
+        self._manifest_pending: List[Tuple[str, Optional[Future]]] = []
+        self._manifest_recorded = 0  # files recorded since the last write
+        if config.manifest_path and not config.dry_run:
+            self._open_manifest(config.manifest_path)
+    
+    def close(self):
+        """Release all resources of the Immich client, write the manifest"""
+        try:
+            if self._manifest_file is not None:
+                self._write_manifest()
+                self._manifest_file.close()
+                self._manifest_file = None
+        finally:
+            self.immich_client.close()
+    
+    def _open_manifest(self, path: str):
+        """Load the keys of migrated files and open the manifest for appending
+        
+        The first line names the Immich server; a manifest of another server is
+        discarded, so a migration to a new server does not skip any files.
+        """
+        header = f"# {self.config.immich_url}"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            lines = []
+        
+        if lines and lines[0] == header:
+            self._migrated = set(lines[1:])
+            self._manifest_file = open(path, 'a', encoding='utf-8')
+            logger.info(f"Manifest: {len(self._migrated)} files already migrated")
+        else:
+            if lines:
+                logger.warning(f"Manifest {path} belongs to another Immich server - starting a new one")
+            self._manifest_file = open(path, 'w', encoding='utf-8')
+            self._manifest_file.write(header + '\n')
+    
+    def _skip_migrated(self, media_files: Iterable[Tuple[Path, Path]]) -> Iterator[Tuple[Path, Path]]:
+        """Filter out files listed in the manifest (unchanged size and mtime)"""
+        for file_path, metadata_path in media_files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                yield file_path, metadata_path
+                continue
+            key = f"{file_path}|{stat.st_size}|{stat.st_mtime_ns}"
+            if key in self._migrated:
+                self.stats['total_files'] += 1
+                self.stats['skipped_files'] += 1
+                continue
+            self._manifest_keys[file_path] = key
+            yield file_path, metadata_path
+    
+    def _write_manifest(self):
+        """Append completely migrated files to the manifest and sync it to disk
+        
+        Files whose album assignment has not been sent yet stay pending; files
+        whose album assignment failed are dropped, so a later run retries them.
+        """
+        lines = []
+        still_pending = []
+        for key, album_result in self._manifest_pending:
+            if album_result is not None and not album_result.done():
+                still_pending.append((key, album_result))
+            elif album_result is None or album_result.result():
+                lines.append(key + '\n')
+        self._manifest_pending = still_pending
+        self._manifest_recorded = 0
+        
+        if lines:
+            self._manifest_file.write(''.join(lines))
+            self._manifest_file.flush()
+            os.fsync(self._manifest_file.fileno())
     
-    def process_takeout(self, takeout_path: str):
-        """Process Google Photos Takeout data"""
+    def process_takeout(self, takeout_path: str) -> bool:
+        """Process Google Photos Takeout data
+        
+        Returns:
+            bool: False if the migration could not be started
+        """
         takeout_dir = Path(takeout_path)
         
         if not takeout_dir.exists():
             logger.error(f"Takeout directory does not exist: {takeout_path}")
-            return
+            return False
         
         logger.info(f"Starting processing of: {takeout_path}")
         
+        # Fail fast on a wrong URL instead of after scanning the whole Takeout
+        if not self.config.dry_run and not self.immich_client.ping():
+            return False
+        
         # Load existing albums
         self.immich_client.load_existing_albums()
-        
-        # Find all media files
-        media_files = self._find_media_files(takeout_dir)
-        self.stats['total_files'] = len(media_files)
-        
-        logger.info(f"Found: {len(media_files)} media files")
+        self.immich_client.load_existing_assets()
         
         if self.config.verbose:
             logger.info(f"Processing with {self.config.max_workers} workers, batch size: {self.config.batch_size}")
         
-        if not media_files:
-            logger.warning("No media files found!")
-            return
+        # Process files in batches while the directory scan is still running,
+        # so the first uploads do not wait for the whole Takeout to be walked.
+        # Walked from the resolved path, so manifest and checksum cache keys are
+        # the same whatever the working directory or spelling of --takeout-path.
+        media_files = self._iter_media_files(str(takeout_dir.resolve()))
+        if self._manifest_file is not None:
+            media_files = self._skip_migrated(media_files)
+        try:
+            self._process_files_in_batches(media_files)
+        finally:
+            # Send queued album assignments, also if the migration was interrupted
+            self.immich_client.flush_albums()
         
-        # Process files in batches
-        self._process_files_in_batches(media_files)
+        logger.info(f"Found: {self.stats['total_files']} media files")
+        
+        if not self.stats['total_files']:
+            logger.warning("No media files found!")
+            return True
         
         # Print final statistics
         self._print_statistics()
+        return True
     
-    def _find_media_files(self, directory: Path) -> List[Tuple[Path, Path, Optional[str]]]:
-        """Find all media files and their metadata"""
-        media_files = []
-        
-        for root, dirs, files in os.walk(directory):
-            root_path = Path(root)
-            
-            # Check if this is an album directory
-            album_title = None
-            metadata_file = root_path / "Metadaten.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                        album_data = json.load(f)
-                        album_title = album_data.get('title', '')
-                        logger.info(f"Found album: {album_title}")
-                except Exception as e:
-                    logger.warning(f"Could not read album metadata {metadata_file}: {e}")
-            
-            # Find media files
-            for file in files:
-                if self._is_media_file(file):
-                    file_path = root_path / file
-                    metadata_path = self._find_metadata_file(file_path)
-                    
-                    if metadata_path:
-                        media_files.append((file_path, metadata_path, album_title))
+    def _iter_media_files(self, directory: str) -> Iterator[Tuple[Path, Path]]:
+        """Yield media files of a directory, then those of its subdirectories
+        
+        Uses one os.scandir() per directory; sidecar metadata files are looked up
+        in the directory listing instead of with a stat call per file.
+        """
+        file_names = []
+        subdirectories = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
                     else:
-                        logger.warning(f"No metadata found for: {file_path}")
+                        file_names.append(entry.name)
+        except OSError as e:
+            logger.warning(f"Could not read directory {directory}: {e}")
+            return
         
-        return media_files
+        names = set(file_names)
+        root_path = Path(directory)
+        
+        # Find media files
+        for name in file_names:
+            if self._is_media_file(name):
+                metadata_name = self._find_metadata_file(name, names)
+                
+                if metadata_name:
+                    yield root_path / name, root_path / metadata_name
+                else:
+                    logger.warning(f"No metadata found for: {root_path / name}")
+        
+        for subdirectory in subdirectories:
+            yield from self._iter_media_files(subdirectory)
     
     def _is_media_file(self, filename: str) -> bool:
         """Check if file is a supported media file"""
-        media_extensions = {
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif',
-            '.heic', '.heif', '.mp4', '.mov', '.avi', '.mkv', '.webm'
-        }
-        return Path(filename).suffix.lower() in media_extensions
+        _, dot, extension = filename.rpartition('.')
+        return bool(dot) and extension.lower() in MEDIA_EXTENSIONS
     
-    def _find_metadata_file(self, file_path: Path) -> Optional[Path]:
-        """Find metadata file for a media file"""
-        possible_names = [
-            f"{file_path.name}.supplemental-metadata.json",
-            f"{file_path.name}.supplemental-metadata copy.json"
-        ]
-        
-        for name in possible_names:
-            metadata_path = file_path.parent / name
-            if metadata_path.exists():
-                return metadata_path
+    def _find_metadata_file(self, filename: str, directory_names: Set[str]) -> Optional[str]:
+        """Find name of the metadata file for a media file in its directory listing"""
+        for suffix in METADATA_SUFFIXES:
+            metadata_name = filename + suffix
+            if metadata_name in directory_names:
+                return metadata_name
         
         return None
     
-    def _process_files_in_batches(self, media_files: List[Tuple[Path, Path, Optional[str]]]):
-        """Process files in batches with parallel execution"""
-        total_batches = (len(media_files) + self.config.batch_size - 1) // self.config.batch_size
+    def _process_files_in_batches(self, media_files: Iterable[Tuple[Path, Path]]):
+        """Process files in batches with parallel execution
+        
+        Uploads run in a sliding window: as soon as one file finishes, the next
+        one is submitted, so a single slow upload never stalls a whole batch.
+        The window is also limited to MAX_IN_FLIGHT_BYTES, so several large
+        videos are not read at once and do not evict each other from the page
+        cache between hashing and upload.
+        
+        media_files may be a lazy iterator; batches are taken from it as the
+        window drains, and stats['total_files'] is counted along the way.
+        With config.adaptive_batch the batch size grows while uploads have to
+        wait for the next batch (see _tune_batch_size).
+        
+        Checksums of the next batch are computed while the current batch is
+        uploaded, so hashing (disk/CPU) overlaps with uploading (network).
+        Only up to MAX_HASH_AHEAD_BYTES of a batch are hashed ahead; larger
+        files are hashed by their upload worker, right before the upload.
+        """
+        media_files = iter(media_files)
+        in_flight: Dict[Future, Tuple[Path, int]] = {}
+        in_flight_bytes = 0
+        batch_size = self.config.batch_size
         
         with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            for i in range(0, len(media_files), self.config.batch_size):
-                batch = media_files[i:i + self.config.batch_size]
-                batch_num = i // self.config.batch_size + 1
+            batch = self._take_batch(media_files, batch_size)
+            for batch_num in itertools.count(1):
+                if not batch:
+                    break
+                self.stats['total_files'] += len(batch)
                 
                 if self.config.verbose:
-                    logger.info(f"Processing batch {batch_num}/{total_batches}")
+                    logger.info(f"Processing batch {batch_num} ({self.stats['total_files']} files found so far)")
                 
-                # Submit batch tasks
-                future_to_file = {
-                    executor.submit(self._process_single_file, file_path, metadata_path, album_title): file_path
-                    for file_path, metadata_path, album_title in batch
-                }
+                # Start hashing the next batch, then skip uploads of files Immich already has
+                next_batch = self._take_batch(media_files, batch_size)
+                existing_assets = self.immich_client.find_existing_assets([file_path for file_path, _ in batch])
                 
-                # Process completed tasks
-                for future in as_completed(future_to_file):
-                    file_path = future_to_file[future]
-                    try:
-                        result = future.result()
-                        if result:
-                            self.stats['processed_files'] += 1
-                            # Distinguish between new uploads and duplicates
-                            if result.get('is_duplicate'):
-                                self.stats['duplicates_found'] += 1
-                            else:
-                                self.stats['new_uploads'] += 1
-                        else:
-                            self.stats['failed_files'] += 1
-                    except Exception as e:
-                        logger.error(f"Unexpected error for {file_path}: {e}")
-                        self.stats['failed_files'] += 1
-    
-    def _process_single_file(self, file_path: Path, metadata_path: Path, album_title: Optional[str]) -> Optional[Dict]:
+                # Upload slots that finished while this batch was prepared sat idle
+                if self.config.adaptive_batch and in_flight:
+                    idle_slots = sum(future.done() for future in in_flight)
+                    batch_size = self._tune_batch_size(batch_size, idle_slots)
+                
+                for file_path, metadata_path in batch:
+                    file_size = self._get_file_size(file_path)
+                    
+                    # Wait for a free slot (and enough byte budget) before submitting the next upload
+                    while in_flight and (len(in_flight) >= self.config.max_workers or
+                                         in_flight_bytes + file_size > MAX_IN_FLIGHT_BYTES):
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            done_path, done_size = in_flight.pop(future)
+                            in_flight_bytes -= done_size
+                            self._record_result(future, done_path)
+                    
+                    future = executor.submit(self._process_single_file, file_path, metadata_path,
+                                             existing_assets.get(file_path))
+                    in_flight[future] = (file_path, file_size)
+                    in_flight_bytes += file_size
+                
+                batch = next_batch
+            
+            # Process remaining tasks
+            for future in as_completed(in_flight):
+                self._record_result(future, in_flight[future][0])
+    
+    def _take_batch(self, media_files: Iterator[Tuple[Path, Path]], batch_size: int) -> List[Tuple[Path, Path]]:
+        """Take the next batch from media_files and start hashing its files in the background
+        
+        Files that do not fit into MAX_HASH_AHEAD_BYTES are skipped, so hashing
+        never runs far ahead of the upload and evicts files from the page cache.
+        """
+        batch = list(itertools.islice(media_files, batch_size))
+        hash_ahead = []
+        hash_ahead_bytes = 0
+        for file_path, _ in batch:
+            file_size = self._get_file_size(file_path)
+            if hash_ahead_bytes + file_size <= MAX_HASH_AHEAD_BYTES:
+                hash_ahead.append(file_path)
+                hash_ahead_bytes += file_size
+        self.immich_client.precompute_checksums(hash_ahead)
+        return batch
+    
+    def _tune_batch_size(self, batch_size: int, idle_slots: int) -> int:
+        """Grow the batch size while the upload window starves
+        
+        Upload concurrency is fixed by the window, so the batch size only
+        affects how well the per-batch latency (waiting for the last checksums,
+        the bulk check) is hidden behind running uploads. If upload slots were
+        idle by the time a batch was ready, the batch is doubled, up to
+        MAX_BATCH_SIZE_FACTOR * --batch-size; otherwise it is kept.
+        """
+        if not idle_slots:
+            return batch_size
+        
+        new_size = min(batch_size * 2, self.config.batch_size * MAX_BATCH_SIZE_FACTOR)
+        if new_size != batch_size:
+            logger.debug(f"Batch size {batch_size} -> {new_size} ({idle_slots} upload slots idle)")
+        return new_size
+    
+    def _get_file_size(self, file_path: Path) -> int:
+        """Get file size in bytes (0 if the file cannot be accessed)"""
+        try:
+            return file_path.stat().st_size
+        except OSError:
+            return 0
+    
+    def _record_result(self, future: Future, file_path: Path):
+        """Update statistics (and the manifest) with the result of a finished upload task"""
+        manifest_key = self._manifest_keys.pop(file_path, None)
+        try:
+            result = future.result()
+            if result:
+                self.stats['processed_files'] += 1
+                if manifest_key and result.get('complete'):
+                    self._manifest_pending.append((manifest_key, result.get('album_result')))
+                    self._manifest_recorded += 1
+                    if self._manifest_recorded >= MANIFEST_SYNC_INTERVAL:
+                        self._write_manifest()
+                # Distinguish between new uploads and duplicates
+                if result.get('is_duplicate'):
+                    self.stats['duplicates_found'] += 1
+                else:
+                    self.stats['new_uploads'] += 1
+            else:
+                self.stats['failed_files'] += 1
+        except Exception as e:
+            logger.error(f"Unexpected error for {file_path}: {e}")
+            self.stats['failed_files'] += 1
+    
+    def _process_single_file(self, file_path: Path, metadata_path: Path,
+                             existing_asset_id: Optional[str] = None) -> Optional[Dict]:
         """Process a single media file"""
         try:
             # Load metadata
@@ -584,27 +1501,24 @@ class GooglePhotosProcessor:
             if not metadata:
                 return None
             
-            # Prepare upload metadata
-            upload_metadata = self._prepare_upload_metadata(file_path, metadata)
+            # Album of the directory (read once per directory)
+            album_title = _album_title_for_dir(str(file_path.parent))
             
-            # Upload asset
-            result = self.immich_client.upload_asset(file_path, upload_metadata, album_title)
-            
-            if result:
-                self.processed_files.add(str(file_path))
-                return result
-            else:
-                return None
+            # Upload asset (successful files are counted in stats['processed_files'])
+            return self.immich_client.upload_asset(file_path, metadata, album_title, existing_asset_id)
                 
         except Exception as e:
             logger.error(f"Error processing {file_path}: {e}")
             return None
+        finally:
+            # Skipped files (e.g. without valid metadata) never fetch their precomputed checksum
+            self.immich_client.discard_checksum(file_path)
     
     def _load_metadata(self, metadata_path: Path) -> Optional[Dict]:
-        """Load metadata from JSON file"""
+        """Load upload metadata (fileCreatedAt, fileModifiedAt, geoData) from JSON file"""
         try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(metadata_path, 'rb') as f:
+                data = json_loads(f.read())
             
             # Extract relevant metadata
             metadata = {}
@@ -634,21 +1548,6 @@ class GooglePhotosProcessor:
             logger.warning(f"Could not load metadata from {metadata_path}: {e}")
             return None
     
-    def _prepare_upload_metadata(self, file_path: Path, metadata: Dict) -> Dict:
-        """Prepare metadata for upload"""
-        upload_metadata = {}
-        
-        # File creation time
-        if 'fileCreatedAt' in metadata:
-            upload_metadata['fileCreatedAt'] = metadata['fileCreatedAt']
-            upload_metadata['fileModifiedAt'] = metadata['fileModifiedAt']
-        
-        # Geo data
-        if 'geoData' in metadata:
-            upload_metadata['geoData'] = metadata['geoData']
-        
-        return upload_metadata
-    
     def _print_statistics(self):
         """Print detailed processing statistics"""
         elapsed_time = time.time() - self.stats['start_time']
@@ -663,8 +1562,10 @@ class GooglePhotosProcessor:
         logger.info("📊 UPLOAD STATISTICS:")
         logger.info(f"   📁 Total files found: {self.stats['total_files']}")
         logger.info(f"   ✅ Successfully processed: {self.stats['processed_files']}")
+        logger.info(f"   ⏭️  Already migrated (skipped): {self.stats['skipped_files']}")
         logger.info(f"   ❌ Failed: {self.stats['failed_files']}")
-        logger.info(f"   📈 Success rate: {(self.stats['processed_files'] / self.stats['total_files'] * 100):.1f}%")
+        succeeded = self.stats['processed_files'] + self.stats['skipped_files']
+        logger.info(f"   📈 Success rate: {(succeeded / self.stats['total_files'] * 100):.1f}%")
         logger.info("")
         logger.info("🔄 UPLOAD DETAILS:")
         logger.info(f"   🆕 New uploads: {self.stats['new_uploads']}")
@@ -678,6 +1579,7 @@ class GooglePhotosProcessor:
         logger.info("🔧 METADATA STATISTICS:")
         logger.info(f"   🔄 Metadata updated: {self.stats['metadata_updates']}")
         logger.info(f"   ✅ Metadata already correct: {self.stats['metadata_already_correct']}")
+        logger.info(f"   ❌ Metadata update failed: {self.stats['metadata_failed']}")
         logger.info("")
         logger.info("=" * 70)
         logger.info("🎯 SUMMARY:")
@@ -722,11 +1624,27 @@ def main():
     parser.add_argument('--max-workers', type=int, default=10, 
                        help='Number of parallel workers')
     parser.add_argument('--batch-size', type=int, default=100, 
-                       help='Batch size for processing')
+                       help='Batch size for processing (starting value with adaptive batching)')
+    parser.add_argument('--adaptive-batch', dest='adaptive_batch', action='store_true', default=True,
+                        help='Grow the batch size while uploads wait for the next batch (default)')
+    parser.add_argument('--no-adaptive-batch', dest='adaptive_batch', action='store_false',
+                        help='Always use exactly --batch-size')
+    parser.add_argument('--album-batch-size', type=int, default=ALBUM_BATCH_SIZE,
+                        help='Number of assets added to an album per request')
     parser.add_argument('--timeout', type=int, default=300, 
                         help='Timeout for HTTP requests in seconds')
     parser.add_argument('--verbose', action='store_true',
                         help='Enable verbose logging')
+    parser.add_argument('--hash-cache', default='gphoto_hash_cache.db',
+                        help='SQLite file caching file checksums between runs ("" to disable)')
+    parser.add_argument('--manifest', default='.immich-migrated',
+                        help='File listing completely migrated files, which later runs skip ("" to disable)')
+    parser.add_argument('--http2', action='store_true',
+                        help='Upload assets over HTTP/2 (https only, requires httpx[http2])')
+    parser.add_argument('--checksum-algo', choices=['sha1', 'blake3'], default='sha1',
+                        help='blake3: also skip uploading copies of files already uploaded in this run, '
+                             'using an in-memory BLAKE3 fingerprint (requires the optional blake3 package; '
+                             'SHA-1 is still computed for Immich)')
     
     args = parser.parse_args()
     
@@ -737,14 +1655,24 @@ def main():
         takeout_path=args.takeout_path,
         max_workers=args.max_workers,
         batch_size=args.batch_size,
+        adaptive_batch=args.adaptive_batch,
+        album_batch_size=max(1, args.album_batch_size),
+        http2=args.http2,
         timeout=args.timeout,
         dry_run=False,
-        verbose=args.verbose
+        verbose=args.verbose,
+        checksum_algo=args.checksum_algo,
+        hash_cache_path=args.hash_cache,
+        manifest_path=args.manifest
     )
     
-    # Validation
-    if not os.path.exists(config.takeout_path):
-        logger.error(f"Takeout path does not exist: {config.takeout_path}")
+    # Verbose: also show DEBUG details of this script (not of libraries)
+    if config.verbose:
+        logger.setLevel(logging.DEBUG)
+    
+    # Validation (one stat call, which also rejects a file given as takeout path)
+    if not os.path.isdir(config.takeout_path):
+        logger.error(f"Takeout path does not exist or is no directory: {config.takeout_path}")
         return 1
     
     if not config.immich_api_key:
@@ -753,8 +1681,9 @@ def main():
     
     # Start migration
     try:
-        processor = GooglePhotosProcessor(config)
-        processor.process_takeout(config.takeout_path)
+        with closing(GooglePhotosProcessor(config)) as processor:
+            if not processor.process_takeout(config.takeout_path):
+                return 1
         return 0
     except KeyboardInterrupt:
         logger.info("Migration cancelled by user")
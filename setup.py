@@ -6,36 +6,64 @@ Setup-Script für Google Photos zu Immich Migration
 import subprocess
 import sys
 import os
+import py_compile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 
-def install_requirements():
-    """Installiert die erforderlichen Abhängigkeiten"""
-    print("📦 Installiere Abhängigkeiten...")
+def requirements_satisfied():
+    """Prüft, ob alle Pakete aus requirements.txt schon in passender Version installiert sind"""
     try:
-        # Versuche verschiedene pip-Varianten
-        pip_commands = [
-            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
-            ["pip3", "install", "-r", "requirements.txt"],
-            ["pip", "install", "-r", "requirements.txt"]
-        ]
-        
-        for cmd in pip_commands:
-            try:
-                subprocess.check_call(cmd)
-                print("✅ Abhängigkeiten erfolgreich installiert")
-                return True
-            except (subprocess.CalledProcessError, FileNotFoundError):
+        from importlib.metadata import version, PackageNotFoundError
+        from packaging.requirements import Requirement
+    except ImportError:
+        # Ohne packaging lässt sich die Version nicht prüfen, dann entscheidet pip
+        return False
+    
+    try:
+        with open("requirements.txt", "r", encoding='utf-8') as f:
+            lines = [line.split("#", 1)[0].strip() for line in f]
+        for line in lines:
+            if not line:
                 continue
-        
-        print("❌ Konnte pip nicht finden. Bitte installiere die Abhängigkeiten manuell:")
-        print("   pip3 install requests urllib3")
+            req = Requirement(line)
+            if req.marker is not None and not req.marker.evaluate():
+                continue
+            if not req.specifier.contains(version(req.name), prereleases=True):
+                return False
+    except (OSError, ValueError, PackageNotFoundError):
         return False
+    
+    return True
+
+
+def run_pip():
+    """Führt pip aus und sammelt seine Ausgabe (läuft im Hintergrund, gibt selbst nichts aus)"""
+    # pip des laufenden Interpreters, damit die Pakete für genau dieses Python installiert werden;
+    # --prefer-binary nimmt fertige Wheels statt Quellpakete neu zu bauen
+    return subprocess.run(
+        [sys.executable, "-m", "pip", "install", "--prefer-binary", "-r", "requirements.txt"],
+        capture_output=True, text=True
+    )
+
+
+def install_requirements(pip_future: Future):
+    """Wartet auf pip und gibt dessen Ausgabe und Ergebnis aus"""
+    try:
+        result = pip_future.result()
+        # Beide Ausgaben nach stdout, damit sie in der Reihenfolge der übrigen Meldungen bleiben
+        print(result.stdout + result.stderr, end="")
+        if result.returncode != 0:
+            print(f"❌ pip ist fehlgeschlagen (Exit-Code {result.returncode}). Bitte installiere die Abhängigkeiten manuell:")
+            print(f"   {sys.executable} -m pip install -r requirements.txt")
+            return False
+        print("✅ Abhängigkeiten erfolgreich installiert")
+        return True
         
     except Exception as e:
         print(f"❌ Fehler beim Installieren der Abhängigkeiten: {e}")
         print("Bitte installiere die Abhängigkeiten manuell:")
-        print("   pip3 install requests urllib3")
+        print(f"   {sys.executable} -m pip install -r requirements.txt")
         return False
 
 
@@ -59,25 +87,23 @@ def test_installation():
     # Teste Python-Version
     print(f"Python-Version: {sys.version}")
     
-    # Teste Import der Module
-    try:
-        import requests
-        print(f"✅ requests {requests.__version__} verfügbar")
-    except ImportError as e:
-        print(f"❌ requests nicht verfügbar: {e}")
-        return False
-    
-    try:
-        import urllib3
-        print(f"✅ urllib3 {urllib3.__version__} verfügbar")
-    except ImportError as e:
-        print(f"❌ urllib3 nicht verfügbar: {e}")
-        return False
+    # Teste installierte Module (liest nur die Paket-Metadaten, ohne die Module zu importieren)
+    from importlib.metadata import version, PackageNotFoundError
+    for package in ("requests", "urllib3"):
+        try:
+            print(f"✅ {package} {version(package)} verfügbar")
+        except PackageNotFoundError as e:
+            print(f"❌ {package} nicht verfügbar: {e}")
+            return False
     
-    # Teste Script-Syntax
+    return True
+
+
+def check_syntax():
+    """Prüft die Syntax der Scripts (braucht keine installierten Abhängigkeiten)"""
+    # Schreibt den Bytecode nach __pycache__, den Python danach wiederverwendet
     try:
-        with open("gphoto_to_immich.py", "r", encoding='utf-8') as f:
-            compile(f.read(), "gphoto_to_immich.py", "exec")
+        py_compile.compile("gphoto_to_immich.py", doraise=True)
         print("✅ Hauptscript-Syntax ist korrekt")
     except Exception as e:
         print(f"❌ Syntax-Fehler im Hauptscript: {e}")
@@ -85,8 +111,7 @@ def test_installation():
     
     # Teste Test-Script
     try:
-        with open("test_migration.py", "r", encoding='utf-8') as f:
-            compile(f.read(), "test_migration.py", "exec")
+        py_compile.compile("test_migration.py", doraise=True)
         print("✅ Test-Script-Syntax ist korrekt")
     except Exception as e:
         print(f"❌ Syntax-Fehler im Test-Script: {e}")
@@ -107,15 +132,22 @@ def main():
     
     print(f"✅ Python {sys.version.split()[0]} erkannt")
     
-    # Installiere Abhängigkeiten
-    if not install_requirements():
-        return 1
-    
-    # Mache Scripts ausführbar
-    make_executable()
+    # Installiere Abhängigkeiten im Hintergrund, währenddessen Scripts ausführbar
+    # machen und ihre Syntax prüfen; die Ausgabe von pip folgt danach gesammelt
+    pip_needed = not requirements_satisfied()
+    if pip_needed:
+        print("📦 Installiere Abhängigkeiten im Hintergrund...")
+    else:
+        print("✅ Abhängigkeiten bereits installiert")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pip_future = executor.submit(run_pip) if pip_needed else None
+        make_executable()
+        syntax_ok = check_syntax()
+        if pip_future is not None and not install_requirements(pip_future):
+            return 1
     
     # Teste Installation
-    if not test_installation():
+    if not test_installation() or not syntax_ok:
         return 1
     
     print("\n" + "=" * 50)
@@ -7,14 +7,25 @@ Tests the migration with sample files in the examples/ folder.
 
 import os
 import sys
+import queue
+import hashlib
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Add script directory to Python path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
-from gphoto_to_immich import Config, GooglePhotosProcessor
+from gphoto_to_immich import ALBUM_METADATA_FILE, Config, GooglePhotosProcessor, MEDIA_EXTENSIONS, json_loads
+
+# Max. number of scanned directories waiting to be analyzed
+SCAN_QUEUE_SIZE = 64
+
+# Parallel Metadaten.json reads (I/O bound, so more threads than CPUs)
+ALBUM_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def test_migration():
@@ -60,7 +71,102 @@ def test_migration():
         return False
 
 
-def analyze_examples(takeout_path: Optional[str] = None):
+def _iter_dirs(directory: str) -> Iterator[Tuple[str, List[os.DirEntry], bool]]:
+    """Yield (directory, media files, is album) for a directory and all its subdirectories
+    
+    Directories are yielded top-down; a directory is an album if it contains
+    Metadaten.json. DirEntry.is_dir()/is_file() use the file
+    type returned by readdir, so no extra stat() is needed per file. Only one
+    directory listing is held at a time. Unreadable directories are reported
+    and skipped.
+    """
+    media_files = []
+    subdirs = []
+    is_album = False
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                if entry.name == ALBUM_METADATA_FILE:
+                    is_album = True
+                    continue
+                _, dot, extension = entry.name.rpartition('.')
+                if dot and extension.lower() in MEDIA_EXTENSIONS and entry.is_file(follow_symlinks=False):
+                    media_files.append(entry)
+    except OSError as e:
+        print(f"WARNING: Could not read directory {directory}: {e}")
+        return
+    yield directory, media_files, is_album
+    for subdir in subdirs:
+        yield from _iter_dirs(subdir)
+
+
+def _scan(directory: str, out: queue.Queue):
+    """Producer thread: put the scanned directories into out, followed by None"""
+    try:
+        for item in _iter_dirs(directory):
+            out.put(item)
+    finally:
+        out.put(None)
+
+
+def _md5(path: str) -> str:
+    """MD5 of a file"""
+    md5 = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _group_identical_optimized(files: List[os.DirEntry]) -> List[List[os.DirEntry]]:
+    """Find groups of identical files
+    
+    Files are grouped by size first; only files sharing a size are hashed,
+    in parallel (hashlib releases the GIL for large buffers).
+    """
+    by_size: Dict[int, List[os.DirEntry]] = defaultdict(list)
+    for entry in files:
+        by_size[entry.stat().st_size].append(entry)
+    candidates = [entry for bucket in by_size.values() if len(bucket) > 1 for entry in bucket]
+    
+    by_hash: Dict[str, List[os.DirEntry]] = defaultdict(list)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for entry, digest in zip(candidates, executor.map(_md5, (entry.path for entry in candidates))):
+            by_hash[digest].append(entry)
+    return [group for group in by_hash.values() if len(group) > 1]
+
+
+def _album_label(dir_path: Path) -> str:
+    """Describe an album directory with the title from its Metadaten.json"""
+    try:
+        with open(dir_path / ALBUM_METADATA_FILE, 'rb') as f:
+            album_data = json_loads(f.read())
+        return f"📁 Album: {album_data.get('title', 'Unknown')}"
+    except Exception as e:
+        return f"📁 Album: (could not read metadata: {e})"
+
+
+def _print_directory(number: int, relative_path: Path, label: str, media_files: List[os.DirEntry]):
+    """Print the analysis of one directory"""
+    print(f"{number:2d}. {relative_path}")
+    print(f"    {label}")
+    print(f"    📷 Media files: {len(media_files)}")
+    
+    # Show first few files
+    if media_files:
+        print(f"    📄 Sample files:")
+        for file in media_files[:3]:
+            print(f"        - {file.name}")
+        if len(media_files) > 3:
+            print(f"        ... and {len(media_files) - 3} more")
+    
+    print()
+
+
+def analyze_examples(takeout_path: Optional[str] = None, find_duplicates: bool = False):
     """Analyze sample files and show their structure"""
     
     if takeout_path:
@@ -73,57 +179,50 @@ def analyze_examples(takeout_path: Optional[str] = None):
     print("SAMPLE FILES ANALYSIS")
     print("=" * 60)
     
-    if not takeout_dir.exists():
+    if not takeout_dir.is_dir():
         print(f"Takeout directory not found: {takeout_dir}")
         return
     
     print(f"Analyzing: {takeout_dir}")
     print()
     
-    # Find all directories
-    directories = []
-    for root, dirs, files in os.walk(takeout_dir):
-        root_path = Path(root)
-        if root_path != takeout_dir:  # Skip root directory
-            directories.append(root_path)
+    # Scan in a background thread and report each directory as soon as it is found
+    scanned: queue.Queue = queue.Queue(maxsize=SCAN_QUEUE_SIZE)
+    threading.Thread(target=_scan, args=(str(takeout_dir), scanned), daemon=True).start()
+    
+    all_media: List[os.DirEntry] = []
+    directory_count = 0
+    # Album metadata is read in parallel; results are printed in scan order
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=ALBUM_READ_WORKERS) as executor:
+        for directory, media_files, is_album in iter(scanned.get, None):
+            if directory == str(takeout_dir):  # Skip root directory
+                continue
+            directory_count += 1
+            if find_duplicates:
+                all_media.extend(media_files)
+            
+            # Only album directories (Metadaten.json seen by the scan) need a file read
+            dir_path = Path(directory)
+            label = executor.submit(_album_label, dir_path) if is_album else None
+            pending.append((directory_count, dir_path.relative_to(takeout_dir), label, media_files))
+            if len(pending) >= 2 * ALBUM_READ_WORKERS:
+                number, relative_path, label, media_files = pending.popleft()
+                _print_directory(number, relative_path, label.result() if label else "📂 Folder", media_files)
+        
+        for number, relative_path, label, media_files in pending:
+            _print_directory(number, relative_path, label.result() if label else "📂 Folder", media_files)
     
-    print(f"Found {len(directories)} directories:")
+    print(f"Found {directory_count} directories")
     print()
     
-    for i, dir_path in enumerate(directories, 1):
-        relative_path = dir_path.relative_to(takeout_dir)
-        print(f"{i:2d}. {relative_path}")
-        
-        # Check if it's an album (has Metadaten.json)
-        metadata_file = dir_path / "Metadaten.json"
-        if metadata_file.exists():
-            try:
-                import json
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    album_data = json.load(f)
-                    album_title = album_data.get('title', 'Unknown')
-                    print(f"    📁 Album: {album_title}")
-            except Exception as e:
-                print(f"    📁 Album: (could not read metadata: {e})")
-        else:
-            print(f"    📂 Folder")
-        
-        # Count media files
-        media_files = []
-        for file in dir_path.iterdir():
-            if file.is_file() and file.suffix.lower() in {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.heic', '.heif', '.mp4', '.mov', '.avi', '.mkv', '.webm'}:
-                media_files.append(file)
-        
-        print(f"    📷 Media files: {len(media_files)}")
-        
-        # Show first few files
-        if media_files:
-            print(f"    📄 Sample files:")
-            for file in media_files[:3]:
-                print(f"        - {file.name}")
-            if len(media_files) > 3:
-                print(f"        ... and {len(media_files) - 3} more")
-        
+    if find_duplicates:
+        duplicate_groups = _group_identical_optimized(all_media)
+        print(f"Identical files: {len(duplicate_groups)} groups")
+        for group in duplicate_groups[:10]:
+            print("    🔁 " + ", ".join(str(Path(entry.path).relative_to(takeout_dir)) for entry in group))
+        if len(duplicate_groups) > 10:
+            print(f"    ... and {len(duplicate_groups) - 10} more")
         print()
     
     print("=" * 60)
@@ -141,17 +240,19 @@ if __name__ == "__main__":
                        help='Run migration test')
     parser.add_argument('--takeout-path', 
                        help='Path to Google Photos Takeout folder')
+    parser.add_argument('--duplicates', action='store_true',
+                       help='Also list identical files (e.g. album copies of year folder photos)')
     
     args = parser.parse_args()
     
     if args.analyze:
-        analyze_examples(args.takeout_path)
+        analyze_examples(args.takeout_path, args.duplicates)
     elif args.test:
         success = test_migration()
         sys.exit(0 if success else 1)
     else:
         # Default: run both
-        analyze_examples(args.takeout_path)
+        analyze_examples(args.takeout_path, args.duplicates)
         print("\n" + "=" * 60)
         print("STARTING MIGRATION TEST")
         print("=" * 60)